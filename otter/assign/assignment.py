@@ -1,18 +1,45 @@
 """Assignment configurations for Otter Assign"""
 
+import copy
 import datetime as dt
 import fica
-import os
 import pathlib
 import warnings
 import yaml
 
-from typing import Any, Dict, List, Optional, Union
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from ..run.run_autograder.autograder_config import AutograderConfig
 from ..utils import Loggable
 
 
+@dataclass(frozen=True)
+class ExportCellConfig:
+    """
+    An immutable snapshot of the export cell configurations of an assignment that are used to
+    generate the export cells.
+    """
+
+    instructions: str
+    """additional submission instructions to include in the export cell"""
+
+    pdf: bool
+    """whether to include a PDF of the notebook in the generated zip file"""
+
+    filtering: bool
+    """whether the generated PDF should be filtered"""
+
+    force_save: bool
+    """whether to force-save the notebook with JavaScript"""
+
+    run_tests: bool
+    """whether to run student submissions against local tests during export"""
+
+    files: Tuple[str, ...]
+    """other files to include in the student submissions' zip file"""
+
+
 class Assignment(fica.Config, Loggable):
     """
     Configurations for the assignment.
@@ -248,8 +275,20 @@ class Assignment(fica.Config, Loggable):
     generate_tests_dir: Optional[str] = None
     """the path to a directory of test files for Otter Generate"""
 
-    notebook_basename: Optional[str] = None
-    """the basename of the master notebook file"""
+    _master_name: Optional[str] = None
+    """the basename of the master notebook file; updated whenever ``master`` is assigned"""
+
+    _master_suffix: Optional[str] = None
+    """
+    the lowercased file extension of the master notebook file; updated whenever ``master`` is
+    assigned
+    """
+
+    _ag_dir: Optional[pathlib.Path] = None
+    """the path to the autograder output directory; updated whenever ``result`` is assigned"""
+
+    _stu_dir: Optional[pathlib.Path] = None
+    """the path to the student output directory; updated whenever ``result`` is assigned"""
 
     _ag_zip_name: Optional[str] = None
     """
@@ -257,13 +296,25 @@ class Assignment(fica.Config, Loggable):
     since it contians a timestamp
     """
 
+    _is_r: bool = False
+    """whether the language of the assignment is R; updated whenever ``lang`` is assigned"""
+
+    _is_python: bool = False
+    """whether the language of the assignment is Python; updated whenever ``lang`` is assigned"""
+
+    _default_autograder_config: Optional[AutograderConfig] = None
+    """
+    a prototype of the default Otter Generate configurations, shared by all instances and copied
+    when ``generate`` is set to ``True``
+    """
+
     def __init__(self, user_config: Dict[str, Any] = {}, **kwargs) -> None:
-        self._logger.debug(f"Initializing with config: {user_config}")
+        self._logger.debug("Initializing with config: %r", user_config)
         super().__init__(user_config, **kwargs)
 
         # convert true values masking subkey contains to those containers
         if self.generate is True:
-            self.generate = AutograderConfig()
+            self.generate = self._get_default_autograder_config()
         if self.export_cell is True:
             self.export_cell = type(self).ExportCellValue()
 
@@ -272,11 +323,45 @@ class Assignment(fica.Config, Loggable):
                 "The variables key of the assignment config is deprecated and will be removed in " \
                     "v6.0.0. Please use generate.serialized_variables instead.", DeprecationWarning)
 
+    @classmethod
+    def _get_default_autograder_config(cls) -> AutograderConfig:
+        """
+        Get a copy of the default Otter Generate configurations, creating the prototype if it has
+        not been created yet.
+
+        Returns:
+            ``otter.run.run_autograder.autograder_config.AutograderConfig``: the default configs
+        """
+        if cls._default_autograder_config is None:
+            cls._default_autograder_config = AutograderConfig()
+        # use a deep copy since some of the defaults are mutable (e.g. lists)
+        return copy.deepcopy(cls._default_autograder_config)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+
+        # update values cached from the language, master notebook path, and output directory
+        if name == "lang":
+            self._is_r = value == "r"
+            self._is_python = value == "python"
+        elif name == "master":
+            if value is None:
+                self._master_name, self._master_suffix = None, None
+            else:
+                path = pathlib.Path(value)
+                self._master_name, self._master_suffix = path.name, path.suffix.lower()
+        elif name == "result":
+            if value is None:
+                self._ag_dir, self._stu_dir = None, None
+            else:
+                path = pathlib.Path(value)
+                self._ag_dir, self._stu_dir = path / "autograder", path / "student"
+
     def update(self, user_config: Dict[str, Any]):
-        self._logger.debug(f"Updating config: {user_config}")
+        self._logger.debug("Updating config: %r", user_config)
         ret = super().update(user_config)
         if self.generate is True:
-            self.generate = AutograderConfig()
+            self.generate = self._get_default_autograder_config()
         if self.export_cell is True:
             self.export_cell = type(self).ExportCellValue()
         return ret
@@ -286,21 +371,21 @@ class Assignment(fica.Config, Loggable):
         """
         Whether the language of the assignment is R
         """
-        return self.lang == "r"
+        return self._is_r
 
     @property
     def is_python(self):
         """
         Whether the language of the assignment is Python
         """
-        return self.lang == "python"
+        return self._is_python
 
     @property
     def is_rmd(self):
         """
         Whether the input file is an RMarkdown document
         """
-        return self.master.suffix.lower() == ".rmd"
+        return self._master_suffix == ".rmd"
 
     def get_otter_config(self):
         """
@@ -320,10 +405,30 @@ class Assignment(fica.Config, Loggable):
 
         return self.generate.get_user_config()
 
+    def get_export_cell_config(self) -> Optional[ExportCellConfig]:
+        """
+        Get a snapshot of the export cell configurations for this assignment.
+
+        Returns:
+            ``ExportCellConfig | None``: the export cell configurations, or ``None`` if no export
+            cell should be included
+        """
+        if not self.export_cell:
+            return None
+
+        return ExportCellConfig(
+            instructions = self.export_cell.instructions,
+            pdf = self.export_cell.pdf,
+            filtering = self.export_cell.filtering,
+            force_save = self.export_cell.force_save,
+            run_tests = self.export_cell.run_tests,
+            files = tuple(self.export_cell.files),
+        )
+
     @property
     def notebook_basename(self):
         """the basename of the notebook"""
-        return os.path.basename(str(self.master))
+        return self._master_name
 
     @property
     def ag_notebook_path(self):
@@ -353,7 +458,7 @@ class Assignment(fica.Config, Loggable):
         Returns:
             ``pathlib.Path``: the path to the autograder directory or the specified file within it
         """
-        return self.result / "autograder" / path
+        return self._ag_dir / path if path else self._ag_dir
 
     def get_stu_path(self, path=""):
         """
@@ -365,7 +470,7 @@ class Assignment(fica.Config, Loggable):
         Returns:
             ``pathlib.Path``: the path to the student directory or the specified file within it
         """
-        return self.result / "student" / path
+        return self._stu_dir / path if path else self._stu_dir
 
     def get_python_version(self) -> Optional[str]:
         """
@@ -1,12 +1,143 @@
 """Cell factory for Otter Assign"""
 
+import copy
 import nbformat
+import uuid
 
-from .assignment import Assignment
+from functools import lru_cache
+from typing import Tuple
+
+from .assignment import Assignment, ExportCellConfig
 from .feature_toggle import FeatureToggle
 from .utils import lock
 
 
+_CHECK_ALL_INSTRUCTIONS = "---\n\nTo double-check your work, the cell below will rerun all " \
+    "of the autograder tests."
+"""the source of the Markdown cell preceding the check-all cell"""
+
+_MARKDOWN_RESPONSE = "_Type your answer here, replacing this text._"
+"""the source of the Markdown response cell"""
+
+EXPORT_INSTRUCTIONS = "## Submission\n\nMake sure you have run all cells in your notebook in " \
+    "order before running the cell below, so that all images/graphs appear in the output. The " \
+    "cell below will generate a zip file for you to submit."
+"""the source of the Markdown cell preceding the export cell"""
+
+EXPORT_SAVE_INSTRUCTIONS = " **Please save before exporting!**"
+"""text appended to ``EXPORT_INSTRUCTIONS`` if the notebook is not force-saved"""
+
+EXPORT_SAVE_COMMENT = "# Save your notebook first, then run this cell to export your submission."
+"""a comment included at the top of the export cell if the notebook is not force-saved"""
+
+
+@lru_cache(None)
+def _get_prototype_cell(cell_type: str, source: str, locked: bool) -> nbformat.NotebookNode:
+    """
+    Create a prototype cell with the specified type and source. Return values are stored in an LRU
+    cache, so prototypes are only created once they are first needed.
+
+    Args:
+        cell_type (``str``): the cell type (``"code"`` or ``"markdown"``)
+        source (``str``): the cell source
+        locked (``bool``): whether the cell should be locked
+
+    Returns:
+        ``nbformat.NotebookNode``: the prototype cell; this should not be modified
+    """
+    if cell_type == "code":
+        cell = nbformat.v4.new_code_cell(source)
+    else:
+        cell = nbformat.v4.new_markdown_cell(source)
+    if locked:
+        lock(cell)
+    return cell
+
+
+def new_cell(cell_type: str, source: str, locked: bool = False) -> nbformat.NotebookNode:
+    """
+    Create a cell with the specified type and source by copying a cached prototype. The copy is
+    assigned a new cell ID if the prototype has one so that cell IDs stay unique within a notebook.
+
+    Args:
+        cell_type (``str``): the cell type (``"code"`` or ``"markdown"``)
+        source (``str``): the cell source
+        locked (``bool``): whether the cell should be locked
+
+    Returns:
+        ``nbformat.NotebookNode``: the new cell
+    """
+    return copy_prototype_cell(_get_prototype_cell(cell_type, source, locked))
+
+
+def copy_prototype_cell(prototype: nbformat.NotebookNode) -> nbformat.NotebookNode:
+    """
+    Create a copy of a cached prototype cell. The copy is assigned a new cell ID if the prototype
+    has one so that cell IDs stay unique within a notebook.
+
+    Args:
+        prototype (``nbformat.NotebookNode``): the prototype cell
+
+    Returns:
+        ``nbformat.NotebookNode``: the copy
+    """
+    cell = copy.deepcopy(prototype)
+    if "id" in cell:
+        cell["id"] = uuid.uuid4().hex[:8]
+    return cell
+
+
+@lru_cache(maxsize=32)
+def _get_export_prototype_cells(
+    export_cell: ExportCellConfig,
+) -> Tuple[nbformat.NotebookNode, nbformat.NotebookNode]:
+    """
+    Create prototypes of the export instructions and export cells for the specified export cell
+    configurations. Return values are stored in an LRU cache.
+
+    Args:
+        export_cell (``otter.assign.assignment.ExportCellConfig``): the export cell configurations
+
+    Returns:
+        ``tuple[nbformat.NotebookNode, nbformat.NotebookNode]``: the prototype cells; these should
+        not be modified
+    """
+    instructions_source = EXPORT_INSTRUCTIONS
+
+    # only include save text if force_save is false
+    if not export_cell.force_save:
+        instructions_source += EXPORT_SAVE_INSTRUCTIONS
+
+    if export_cell.instructions:
+        instructions_source += '\n\n' + export_cell.instructions
+
+    instructions = nbformat.v4.new_markdown_cell(instructions_source)
+
+    args = []
+    if not export_cell.filtering:
+        args += ["filtering=False"]
+    if not export_cell.pdf:
+        args += ["pdf=False"]
+    if export_cell.force_save:
+        args += ["force_save=True"]
+    if export_cell.run_tests:
+        args += ["run_tests=True"]
+    if len(export_cell.files) != 0:
+        args += [f"files={list(export_cell.files)}"]
+    export_source = f"grader.export({', '.join(args)})"
+
+    # only include save text if force_save is false
+    if not export_cell.force_save:
+        export_source = EXPORT_SAVE_COMMENT + "\n" + export_source
+
+    export = nbformat.v4.new_code_cell(export_source)
+
+    lock(instructions)
+    lock(export)
+
+    return instructions, export
+
+
 class CellFactory:
     """
     A factory for cells that make use of Otter's client package (e.g. init cell, check cell).
@@ -48,7 +179,7 @@ class CellFactory:
         elif self.assignment.runs_on == "jupyterlite":
             args = "jupyterlite=True"
         else:
-            args  = f"\"{self.assignment.master.name}\""
+            args  = f"\"{self.assignment.notebook_basename}\""
 
         if self.assignment.tests.url_prefix:
             args += f", tests_url_prefix=\"{self.assignment.tests.url_prefix}\""
@@ -81,16 +212,10 @@ class CellFactory:
         Returns:
             ``list[nbformat.NotebookNode]``: the check-all cells
         """
-        instructions = nbformat.v4.new_markdown_cell()
-        instructions.source = "---\n\nTo double-check your work, the cell below will rerun all " \
-            "of the autograder tests."
-
-        check_all = nbformat.v4.new_code_cell("grader.check_all()")
-
-        lock(instructions)
-        lock(check_all)
-
-        return [instructions, check_all]
+        return [
+            new_cell("markdown", _CHECK_ALL_INSTRUCTIONS, locked=True),
+            new_cell("code", "grader.check_all()", locked=True),
+        ]
 
     def create_export_cells(self):
         """
@@ -100,49 +225,13 @@ class CellFactory:
         Returns:
             ``list[nbformat.NotebookNode]``: the export cells
         """
-        if not self.assignment.export_cell:
+        export_cell = self.assignment.get_export_cell_config()
+        if export_cell is None:
             return []
 
-        instructions = nbformat.v4.new_markdown_cell()
-        instructions.source = "## Submission\n\nMake sure you have run all cells in your " \
-            "notebook in order before running the cell below, so that all images/graphs appear " \
-            "in the output. The cell below will generate a zip file for you to submit."
-
-        # only include save text if force_save is false
-        if not self.assignment.export_cell.force_save:
-            instructions.source += " **Please save before exporting!**"
-
-        if self.assignment.export_cell.instructions:
-            instructions.source += '\n\n' + self.assignment.export_cell.instructions
-
-        export = nbformat.v4.new_code_cell()
-        source_lines = []
-
-        # only include save text if force_save is false
-        if not self.assignment.export_cell.force_save:
-            source_lines.append(
-                "# Save your notebook first, then run this cell to export your submission.")
-
-        args = []
-        if not self.assignment.export_cell.filtering:
-            args += ["filtering=False"]
-        if not self.assignment.export_cell.pdf:
-            args += ["pdf=False"]
-        if self.assignment.export_cell.force_save:
-            args += ["force_save=True"]
-        if self.assignment.export_cell.run_tests:
-            args += ["run_tests=True"]
-        if len(self.assignment.export_cell.files) != 0:
-            args += [f"files={self.assignment.export_cell.files}"]
-        source_lines.append(f"grader.export({', '.join(args)})")
-        export.source = "\n".join(source_lines)
-
-        lock(instructions)
-        lock(export)
-
-        cells = [instructions, export]
+        cells = [copy_prototype_cell(c) for c in _get_export_prototype_cells(export_cell)]
         if self.check_feature_toggle(FeatureToggle.EMPTY_MD_BOUNDARY_CELLS):
-            cells.append(nbformat.v4.new_markdown_cell(" "))  # add buffer cell
+            cells.append(new_cell("markdown", " "))  # add buffer cell
 
         return cells
 
@@ -161,4 +250,4 @@ class CellFactory:
         Returns:
             ``nbformat.NotebookNode``: the response cell
         """
-        return nbformat.v4.new_markdown_cell("_Type your answer here, replacing this text._")
+        return new_cell("markdown", _MARKDOWN_RESPONSE)
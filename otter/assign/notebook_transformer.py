@@ -80,11 +80,17 @@ class NotebookTransformer:
         if not FeatureToggle.PDF_FILTERING_COMMENTS.value.is_enabled(self.assignment):
             return cell
 
-        cell = copy.deepcopy(cell)
-        source = get_source(cell)
+        # only the source and the top level of the metadata are modified, so a shallow copy of
+        # those is sufficient
         tag = "<!-- " + ("END" if end else "BEGIN") + " QUESTION -->"
-        source = [tag, ""] + source
-        cell['source'] = "\n".join(source)
+        source = cell["source"]
+        if isinstance(source, str) and "\r" not in source:
+            source = tag + "\n\n" + source
+        else:
+            source = "\n".join([tag, ""] + get_source(cell))
+
+        cell = nbformat.NotebookNode({**cell, "metadata": copy.copy(cell["metadata"])})
+        cell["source"] = source
         lock(cell)
         return cell
 
@@ -2,12 +2,74 @@
 
 import nbformat
 
+from functools import lru_cache
+from typing import Tuple
+
 from otter.assign.feature_toggle import FeatureToggle
 
-from ..cell_factory import CellFactory
+from ..assignment import ExportCellConfig
+from ..cell_factory import (
+    CellFactory,
+    copy_prototype_cell,
+    EXPORT_INSTRUCTIONS,
+    EXPORT_SAVE_COMMENT,
+    EXPORT_SAVE_INSTRUCTIONS,
+    new_cell,
+)
 from ..utils import lock
 
 
+@lru_cache(maxsize=32)
+def _get_export_prototype_cells(
+    export_cell: ExportCellConfig,
+    force_save: bool,
+    notebook_basename: str,
+) -> Tuple[nbformat.NotebookNode, nbformat.NotebookNode]:
+    """
+    Create prototypes of the export instructions and export cells for an R assignment. Return
+    values are stored in an LRU cache.
+
+    Args:
+        export_cell (``otter.assign.assignment.ExportCellConfig``): the export cell configurations
+        force_save (``bool``): whether the notebook should be force-saved
+        notebook_basename (``str``): the basename of the notebook being exported
+
+    Returns:
+        ``tuple[nbformat.NotebookNode, nbformat.NotebookNode]``: the prototype cells; these should
+        not be modified
+    """
+    instructions_source = EXPORT_INSTRUCTIONS
+
+    if not force_save: instructions_source += EXPORT_SAVE_INSTRUCTIONS
+
+    if export_cell.instructions:
+        instructions_source += '\n\n' + export_cell.instructions
+
+    instructions = nbformat.v4.new_markdown_cell(instructions_source)
+
+    args = []
+    if export_cell.pdf:
+        args.append("pdf = TRUE")
+    if force_save:
+        args.append("force_save = TRUE")
+
+    if args:
+        args = ", " + ", ".join(args)
+    else:
+        args = ""
+
+    export_source = f'ottr::export("{notebook_basename}"{args})'
+    if not force_save:
+        export_source = EXPORT_SAVE_COMMENT + "\n" + export_source
+
+    export = nbformat.v4.new_code_cell(export_source)
+
+    lock(instructions)
+    lock(export)
+
+    return instructions, export
+
+
 class RCellFactory(CellFactory):
     """
     A cell factory for R assignments.
@@ -26,43 +88,17 @@ class RCellFactory(CellFactory):
         return []
 
     def create_export_cells(self):
-        if not self.assignment.export_cell:
+        export_cell = self.assignment.get_export_cell_config()
+        if export_cell is None:
             return []
 
-        force_save = not self.assignment.is_rmd and self.assignment.export_cell.force_save
-
-        instructions = nbformat.v4.new_markdown_cell()
-        instructions.source = "## Submission\n\nMake sure you have run all cells in your " \
-            "notebook in order before running the cell below, so that all images/graphs appear " \
-            "in the output. The cell below will generate a zip file for you to submit."
-
-        if not force_save: instructions.source += " **Please save before exporting!**"
-
-        if self.assignment.export_cell.instructions:
-            instructions.source += '\n\n' + self.assignment.export_cell.instructions
-
-        args = []
-        if self.assignment.export_cell.pdf:
-            args.append("pdf = TRUE")
-        if force_save:
-            args.append("force_save = TRUE")
-
-        if args:
-            args = ", " + ", ".join(args)
-        else:
-            args = ""
-
-        export = nbformat.v4.new_code_cell()
-        source_lines = [] if force_save else \
-            ["# Save your notebook first, then run this cell to export your submission."]
-        source_lines.append(f'ottr::export("{self.assignment.notebook_basename}"{args})')
-        export.source = "\n".join(source_lines)
-
-        lock(instructions)
-        lock(export)
+        force_save = not self.assignment.is_rmd and export_cell.force_save
 
-        cells = [instructions, export]
+        cells = [
+            copy_prototype_cell(c) for c in _get_export_prototype_cells(
+                export_cell, force_save, self.assignment.notebook_basename)
+        ]
         if self.check_feature_toggle(FeatureToggle.EMPTY_MD_BOUNDARY_CELLS):
-            cells.append(nbformat.v4.new_markdown_cell(" "))  # add buffer cell
+            cells.append(new_cell("markdown", " "))  # add buffer cell
 
         return cells